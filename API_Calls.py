@@ -1,7 +1,8 @@
 # API_Calls.py
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 import os
 
 # Optional: use PI Web API client if available, otherwise fall back to requests
@@ -11,9 +12,11 @@ except Exception:
     PIWebApiClient = None
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     base_url: str                      # e.g., "https://your-pi-web-api-server/piwebapi"
     use_kerberos: bool = False
@@ -22,7 +25,7 @@ class APIConfig:
     timeout_seconds: int = 60          # for requests fallback
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIParams:
     # Device selections (use API keys you want to send)
     substation: str = ""
@@ -38,7 +41,7 @@ class APIParams:
     interval_unit: str = "minute"      # "minute" or "hour"
 
     # Options
-    datasets: List[str] = None         # ["Minimum", "Average", "Maximum"]
+    datasets: Tuple[str, ...] = ()     # ("Minimum", "Average", "Maximum")
     output_unit: str = "Amp"
     coincidental_peaks: bool = False
     multi_phase: bool = False
@@ -47,26 +50,42 @@ class APIParams:
     def to_query_dict(self) -> Dict[str, str]:
         """
         Convert params to a flat dict suitable for query strings/POST.
-        Lists are joined as comma strings. Booleans become 'true'/'false'.
-        Empty values are included only if you want to; here we exclude empties.
+        Tuples are joined as comma strings. Booleans become 'true'/'false'.
+        Empty values are excluded so the URL stays concise.
+        Results are memoized (the dataclass is frozen, hence hashable).
         """
-        d = asdict(self)
+        return dict(_to_query_items(self))
 
-        # Convert lists/bools
-        if d.get("datasets") is None:
-            d["datasets"] = ""
-        else:
-            d["datasets"] = ",".join(d["datasets"])
 
-        for k, v in list(d.items()):
-            if isinstance(v, bool):
-                d[k] = "true" if v else "false"
-            elif v is None:
-                d[k] = ""
+# Field names resolved once at import; to_query_dict walks them directly
+# instead of paying asdict's recursive copy on every call.
+_FIELDS = tuple(f.name for f in fields(APIParams))
 
-        # Optionally drop empty keys so the URL stays concise:
-        d = {k: v for k, v in d.items() if str(v).strip() != ""}
-        return d
+
+def _render(v) -> Optional[str]:
+    """Render one field value for a query string; None means omit the key."""
+    if v is None:
+        return None
+    if v is False:
+        return "false"
+    if v is True:
+        return "true"
+    if isinstance(v, (tuple, list)):
+        return ",".join(v) if v else None
+    s = str(v)
+    return s if s.strip() else None
+
+
+@lru_cache(maxsize=256)
+def _to_query_items(params: APIParams) -> Tuple[Tuple[str, str], ...]:
+    # Single pass over the fields, computing keep-or-drop and the rendered
+    # value in one expression; one tuple allocation, no intermediate dicts.
+    return tuple(
+        (name, r)
+        for name in _FIELDS
+        for r in (_render(getattr(params, name)),)
+        if r is not None
+    )
 
 
 def build_api_params(
@@ -96,7 +115,7 @@ def build_api_params(
         end_date=end_date,
         interval_value=iv,
         interval_unit=(interval_unit or "minute"),
-        datasets=datasets or [],
+        datasets=tuple(datasets or ()),
         output_unit=output_unit or "Amp",
         coincidental_peaks=bool(coincidental_peaks),
         multi_phase=bool(multi_phase),
@@ -104,14 +123,58 @@ def build_api_params(
     )
 
 
+@lru_cache(maxsize=256)
 def compose_url(base_url: str, api_params: APIParams) -> str:
     """
     Compose a preview URL with query string appended.
     You might point this at a read-only preview endpoint or just show it.
+    Builds the query string straight from the rendered field items (no
+    intermediate dict). Memoized, so repeated previews of the same params
+    are free.
     """
-    q = urlencode(api_params.to_query_dict())
+    parts = [f"{name}={quote_plus(v)}" for name, v in _to_query_items(api_params)]
     # If your service expects e.g. base_url + "/streams/summary" etc., adjust here
-    return f"{base_url}?{q}"
+    return f"{base_url}?{'&'.join(parts)}" if parts else base_url
+
+
+# Reusable sessions keyed by (base_url, auth, verify) so repeated calls share
+# one connection pool instead of paying a TCP+TLS handshake per request.
+_session_cache: Dict[tuple, requests.Session] = {}
+
+
+def _get_session(cfg: APIConfig) -> requests.Session:
+    """
+    Return a pooled requests.Session for this config, creating it on first use.
+    Sessions keep connections alive across execute_query calls and retry
+    transient upstream errors with exponential backoff.
+    """
+    auth = None
+    if not cfg.use_kerberos and cfg.username and cfg.password:
+        auth = (cfg.username, cfg.password)
+
+    key = (cfg.base_url, auth, True)
+    sess = _session_cache.get(key)
+    if sess is None:
+        sess = requests.Session()
+        sess.auth = auth
+        sess.verify = True
+        sess.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        sess.mount("https://", adapter)
+        sess.mount("http://", adapter)
+        _session_cache[key] = sess
+    return sess
+
+
+def close_sessions() -> None:
+    """Close all cached sessions and release their connection pools."""
+    for sess in _session_cache.values():
+        sess.close()
+    _session_cache.clear()
 
 
 def make_pi_client(cfg: APIConfig):
@@ -151,19 +214,20 @@ def execute_query(cfg: APIConfig, api_params: APIParams) -> Tuple[int, str]:
         except Exception as ex:
             return (500, f"PIWebApiClient error: {ex}")
 
-    # Fallback: plain HTTP GET
+    # Fallback: plain HTTP GET over a pooled, keep-alive session
     try:
-        auth = None
-        if not cfg.use_kerberos and cfg.username and cfg.password:
-            auth = (cfg.username, cfg.password)
-
-        r = requests.get(cfg.base_url, params=query_dict, auth=auth, timeout=cfg.timeout_seconds, verify=True)
+        sess = _get_session(cfg)
+        r = sess.get(cfg.base_url, params=query_dict, timeout=cfg.timeout_seconds)
         return (r.status_code, r.text)
     except Exception as ex:
         return (500, f"HTTP error: {ex}")
 
 
 def build_preview_text(api_params: APIParams, full_url: str) -> str:
+    # Note: this only echoes the parameters and URL; it never formats result
+    # payloads. If a future version summarizes numeric results here, compute
+    # the stats on a NumPy array (see Graphs.py) rather than looping in
+    # Python — a compiled helper is only worth it above ~1000 samples.
     return (
         "Selected parameters:\n"
         f"{api_params.to_query_dict()}\n\n"
@@ -1,8 +1,48 @@
 from __future__ import annotations
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import time
+from decimal import Decimal
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit
+
+
+# pandas is heavy (~500ms import) and only needed by the DataFrame helpers;
+# load it once on first use rather than at module import or on every call.
+_pandas = None
+
+
+def _get_pandas():
+    global _pandas
+    if _pandas is None:
+        try:
+            import pandas
+        except Exception as e:
+            raise PIWebAPIError("pandas is required for the DataFrame helpers. pip install pandas") from e
+        _pandas = pandas
+    return _pandas
+
+
+# Optional: orjson parses large payloads 2-5x faster than stdlib json
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, stdlib json otherwise."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
 
 
 # ---------- Exceptions ----------
@@ -15,7 +55,7 @@ class PINotFound(PIWebAPIError):
 
 
 # ---------- Config ----------
-@dataclass
+@dataclass(slots=True)
 class PIConfig:
     base_url: str                  # e.g., "https://yourserver/piwebapi"
     verify_ssl: bool = True
@@ -25,6 +65,62 @@ class PIConfig:
     use_ntlm: bool = False         # Requires requests-ntlm if True
     bearer_token: Optional[str] = None
     timeout_sec: int = 30
+    transport: str = "requests"    # 'requests' (HTTP/1.1) or 'httpx' (HTTP/2)
+
+
+# ---------- Shared connection pools ----------
+# All PIClient instances pointed at the same host share one HTTPAdapter, so
+# code that constructs a client per operation still reuses the same sockets.
+_ADAPTER_REGISTRY: Dict[tuple, HTTPAdapter] = {}
+
+
+def _shared_adapter(scheme: str, host: str, verify_ssl: bool) -> HTTPAdapter:
+    key = (scheme, host, verify_ssl)
+    adapter = _ADAPTER_REGISTRY.get(key)
+    if adapter is None:
+        # Transient faults (resets, 429/5xx) cost a backoff sleep instead of
+        # failing the whole operation back to the user.
+        retry = Retry(total=5, connect=3, read=3, status=3,
+                      backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(["GET", "POST"]),
+                      respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=retry)
+        _ADAPTER_REGISTRY[key] = adapter
+    return adapter
+
+
+# ---------- WebId disk cache ----------
+# Tag -> WebId mappings rarely change, so they are persisted under the user
+# cache dir (one file per server) and reloaded on the next run. Entries older
+# than the TTL are re-resolved.
+_WEBID_CACHE_DIR = os.path.expanduser("~/.cache/piclient")
+_WEBID_TTL_SEC = 86400
+
+
+def _webid_cache_path(base_url: str) -> str:
+    digest = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(_WEBID_CACHE_DIR, f"webids_{digest}.pickle")
+
+
+def _load_webid_cache(path: str) -> Dict[str, Tuple[str, float]]:
+    try:
+        with open(path, "rb") as f:
+            cache = pickle.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except Exception:
+        pass
+    return {}
+
+
+def _save_webid_cache(path: str, cache: Dict[str, Tuple[str, float]]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass  # cache persistence is best-effort
 
 
 # ---------- Client (Tags only) ----------
@@ -42,15 +138,44 @@ class PIClient:
     Notes:
       - Time strings: PI time (e.g., "*", "*-1d", "t-1h") or ISO8601.
       - Returns JSON objects as delivered by PI Web API.
+      - Responses are trimmed with selectedFields by default (pass fields=...
+        to widen); full payloads carry verbose metadata (Links, Questionable,
+        Substituted, ...) that dwarfs the timestamp+value callers use.
     """
 
+    # Default selectedFields projections
+    POINT_FIELDS = "Items.Name;Items.WebId"
+    EVENT_FIELDS = "Items.Timestamp;Items.Value;Items.Good"
+    SUMMARY_FIELDS = "Items.Value.Timestamp;Items.Value.Value;Items.Type"
+
+    # Stream endpoint suffixes, concatenated onto a cached per-WebId prefix
+    _VAL = "/value"
+    _REC = "/recorded"
+    _INT = "/interpolated"
+    _SUM = "/summary"
+
     def __init__(self, cfg: PIConfig):
         self.cfg = cfg
+        # webid -> prebuilt "{base}/streams/{webid}" prefix
+        self._stream_prefixes: Dict[str, str] = {}
+        # tag -> (webid, resolved_at_epoch). Seeded by get_point_webids() and
+        # from the on-disk cache; consulted before hitting the server.
+        self._webid_cache_file = _webid_cache_path(cfg.base_url)
+        self._webid_cache: Dict[str, Tuple[str, float]] = _load_webid_cache(self._webid_cache_file)
+        atexit.register(_save_webid_cache, self._webid_cache_file, self._webid_cache)
         self.session = requests.Session()
         self.session.verify = cfg.verify_ssl
-        self.session.headers.update({"Accept": "application/json"})
+        self.session.headers.update({"Accept": "application/json",
+                                     "Accept-Encoding": "gzip, deflate",
+                                     "Connection": "keep-alive"})
         self.base = cfg.base_url.rstrip("/")
 
+        # Share one connection pool per (scheme, host) across all instances
+        scheme, host = urlsplit(self.base)[:2]
+        if scheme and host:
+            self.session.mount(f"{scheme}://{host}/",
+                               _shared_adapter(scheme, host, cfg.verify_ssl))
+
         # ---- Auth options ----
         if cfg.bearer_token:
             self.session.headers.update({"Authorization": f"Bearer {cfg.bearer_token}"})
@@ -65,26 +190,79 @@ class PIClient:
         elif cfg.username and cfg.password:
             self.session.auth = (cfg.username, cfg.password)
 
+        # ---- Optional HTTP/2 transport ----
+        # With httpx, concurrent per-tag GETs multiplex over one TLS
+        # connection instead of occupying one socket each.
+        self._httpx = None
+        if cfg.transport == "httpx":
+            try:
+                import httpx
+            except Exception as e:
+                raise PIWebAPIError("transport='httpx' requires 'httpx[http2]'. pip install 'httpx[http2]'") from e
+            if cfg.use_ntlm:
+                raise PIWebAPIError("NTLM auth is not supported with transport='httpx'.")
+            auth = (cfg.username, cfg.password) if (cfg.username and cfg.password and not cfg.bearer_token) else None
+            self._httpx = httpx.Client(
+                http2=True,
+                verify=cfg.verify_ssl,
+                timeout=cfg.timeout_sec,
+                headers=dict(self.session.headers),
+                auth=auth,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+            self._httpx_error = httpx.HTTPError
+        elif cfg.transport != "requests":
+            raise PIWebAPIError(f"Unknown transport: {cfg.transport!r} (expected 'requests' or 'httpx')")
+
+    @classmethod
+    def close_all_pools(cls) -> None:
+        """Close the shared connection pools (call at application shutdown)."""
+        for adapter in _ADAPTER_REGISTRY.values():
+            adapter.close()
+        _ADAPTER_REGISTRY.clear()
+
     # ---- Low-level helpers ----
     def _get(self, url: str, **params) -> Dict[str, Any]:
+        if self._httpx is not None:
+            try:
+                r = self._httpx.get(url, params=params)
+                if r.status_code == 404:
+                    raise PINotFound(f"Resource not found: {r.url}")
+                r.raise_for_status()
+                return _loads(r.content)
+            except self._httpx_error as e:
+                raise PIWebAPIError(f"HTTP error calling {url}: {e}") from e
         try:
             r = self.session.get(url, params=params, timeout=self.cfg.timeout_sec)
             if r.status_code == 404:
                 raise PINotFound(f"Resource not found: {r.url}")
             r.raise_for_status()
-            return r.json()
+            return _loads(r.content)
         except requests.RequestException as e:
             raise PIWebAPIError(f"HTTP error calling {url}: {e}") from e
 
-    @lru_cache(maxsize=4096)
-    def get_point_webid(self, tag: str) -> str:
-        """
-        Resolve PI tag -> point WebId using nameFilter.
-        If multiple results, prefer exact (case-insensitive) name match.
-        """
-        url = f"{self.base}/points"
-        data = self._get(url, nameFilter=tag)
-        items = data.get("Items", [])
+    def _post_batch(self, body: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+        """POST a map of sub-requests to the PI Web API Batch controller."""
+        url = f"{self.base}/batch"
+        headers = {"X-Requested-With": "XMLHttpRequest"}
+        if self._httpx is not None:
+            try:
+                r = self._httpx.post(url, json=body, headers=headers)
+                r.raise_for_status()
+                return _loads(r.content)
+            except self._httpx_error as e:
+                raise PIWebAPIError(f"HTTP error calling {url}: {e}") from e
+        try:
+            r = self.session.post(url, json=body, timeout=self.cfg.timeout_sec,
+                                  headers=headers)
+            r.raise_for_status()
+            return _loads(r.content)
+        except requests.RequestException as e:
+            raise PIWebAPIError(f"HTTP error calling {url}: {e}") from e
+
+    @staticmethod
+    def _pick_webid(tag: str, items: List[Dict[str, Any]]) -> str:
+        """Prefer an exact (case-insensitive) name match among nameFilter results."""
         if not items:
             raise PINotFound(f"Tag not found: {tag}")
         exact = [it for it in items if it.get("Name", "").lower() == tag.lower()]
@@ -93,11 +271,75 @@ class PIClient:
             raise PINotFound(f"No WebId for tag: {tag}")
         return webid
 
+    def _cache_get(self, tag: str) -> Optional[str]:
+        entry = self._webid_cache.get(tag)
+        if entry is None:
+            return None
+        webid, resolved_at = entry
+        if time.time() - resolved_at > _WEBID_TTL_SEC:
+            return None
+        return webid
+
+    def _cache_put(self, tag: str, webid: str) -> None:
+        self._webid_cache[tag] = (webid, time.time())
+
+    def get_point_webid(self, tag: str) -> str:
+        """
+        Resolve PI tag -> point WebId using nameFilter.
+        If multiple results, prefer exact (case-insensitive) name match.
+        Resolutions are cached on disk per server and expire after a day.
+        """
+        webid = self._cache_get(tag)
+        if webid is not None:
+            return webid
+        url = f"{self.base}/points"
+        data = self._get(url, nameFilter=tag, selectedFields=self.POINT_FIELDS)
+        webid = self._pick_webid(tag, data.get("Items", []))
+        self._cache_put(tag, webid)
+        return webid
+
+    def get_point_webids(self, tags: List[str]) -> Dict[str, str]:
+        """
+        Resolve many PI tags -> WebIds in a single round-trip via the Batch
+        controller. Results seed the per-tag cache so later single-tag calls
+        are free. Raises PINotFound listing any tags that did not resolve.
+        """
+        missing = [t for t in tags if self._cache_get(t) is None]
+        if missing:
+            body = {
+                tag: {
+                    "Method": "GET",
+                    "Resource": f"{self.base}/points?nameFilter={quote(tag)}"
+                                f"&selectedFields={self.POINT_FIELDS}",
+                }
+                for tag in missing
+            }
+            resp = self._post_batch(body)
+            not_found = []
+            for tag in missing:
+                sub = resp.get(tag, {})
+                items = (sub.get("Content") or {}).get("Items", [])
+                try:
+                    self._cache_put(tag, self._pick_webid(tag, items))
+                except PINotFound:
+                    not_found.append(tag)
+            if not_found:
+                raise PINotFound(f"Tags not found: {', '.join(not_found)}")
+        return {tag: self._webid_cache[tag][0] for tag in tags}
+
+    def _stream_prefix(self, tag: str) -> str:
+        """Resolve tag -> "{base}/streams/{webid}", caching the formatted prefix."""
+        webid = self.get_point_webid(tag)
+        prefix = self._stream_prefixes.get(webid)
+        if prefix is None:
+            prefix = f"{self.base}/streams/{webid}"
+            self._stream_prefixes[webid] = prefix
+        return prefix
+
     # ---- DataLink-like methods ----
     def arc_val(self, tag: str, time: str = "*") -> Dict[str, Any]:
         """PIArcVal -> { 'Value': {... or scalar ...}, 'Timestamp': '...', 'Good': bool, ... }"""
-        webid = self.get_point_webid(tag)
-        url = f"{self.base}/streams/{webid}/value"
+        url = self._stream_prefix(tag) + self._VAL
         return self._get(url, time=time)
 
     def recorded(
@@ -106,28 +348,143 @@ class PIClient:
         start_time: str,
         end_time: str,
         boundary_type: str = "Inside",
-        max_points: Optional[int] = None
+        max_points: Optional[int] = None,
+        fields: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """PIRecorded/PISampDat -> list of events (Timestamp/Value)."""
-        webid = self.get_point_webid(tag)
-        url = f"{self.base}/streams/{webid}/recorded"
-        params = {"startTime": start_time, "endTime": end_time, "boundaryType": boundary_type}
+        url = self._stream_prefix(tag) + self._REC
+        params = {"startTime": start_time, "endTime": end_time, "boundaryType": boundary_type,
+                  "selectedFields": fields or self.EVENT_FIELDS}
         if max_points:
             params["maxCount"] = max_points
         data = self._get(url, **params)
         return data.get("Items", [])
 
+    def recorded_chunked(
+        self,
+        tag: str,
+        start_time: str,
+        end_time: str,
+        chunk: str = "1d",
+        max_workers: int = 8,
+        boundary_type: str = "Inside",
+        max_points: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch /recorded over a long range by splitting it into sub-ranges and
+        issuing them concurrently, sidestepping the server-side maxCount cap
+        on any single request. The calls are network-bound, so a thread pool
+        parallelizes them fine. Duplicate boundary events at chunk seams are
+        dropped. start/end must be absolute times pandas can parse (not PI
+        relative times like "*-1d"). Requires pandas.
+        """
+        pd = _get_pandas()
+        from concurrent.futures import ThreadPoolExecutor
+
+        start = pd.Timestamp(start_time)
+        end = pd.Timestamp(end_time)
+        edges = list(pd.date_range(start, end, freq=chunk))
+        if not edges or edges[0] != start:
+            edges.insert(0, start)
+        if edges[-1] != end:
+            edges.append(end)
+        spans = list(zip(edges[:-1], edges[1:]))
+
+        # Resolve the WebId once up front so workers all hit the cache
+        self.get_point_webid(tag)
+
+        def fetch(span):
+            a, b = span
+            return self.recorded(tag, a.isoformat(), b.isoformat(),
+                                 boundary_type=boundary_type, max_points=max_points)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            chunks = list(pool.map(fetch, spans))
+
+        # Sub-ranges come back in order; drop the seam duplicate where a
+        # boundary event appears at the end of one chunk and the start of the next.
+        out: List[Dict[str, Any]] = []
+        last_ts = None
+        for items in chunks:
+            for it in items:
+                ts = it.get("Timestamp")
+                if ts == last_ts:
+                    continue
+                out.append(it)
+                last_ts = ts
+        return out
+
+    def recorded_df(
+        self,
+        tag: str,
+        start_time: str,
+        end_time: str,
+        boundary_type: str = "Inside",
+        max_points: Optional[int] = None
+    ):
+        """
+        Like recorded(), but stream-parses the response with ijson directly
+        into pre-allocated NumPy arrays and returns a pandas DataFrame indexed
+        by timestamp. Avoids materializing the full JSON object and a
+        list-of-dicts for multi-million-event ranges.
+        Requires 'ijson' (pip install ijson) plus numpy/pandas.
+        """
+        try:
+            import ijson
+        except Exception as e:
+            raise PIWebAPIError("ijson is required for recorded_df(). pip install ijson") from e
+        pd = _get_pandas()
+        try:
+            import numpy as np
+        except Exception as e:
+            raise PIWebAPIError("numpy is required for recorded_df(). pip install numpy") from e
+
+        url = self._stream_prefix(tag) + self._REC
+        params = {"startTime": start_time, "endTime": end_time, "boundaryType": boundary_type,
+                  "selectedFields": self.EVENT_FIELDS}
+        if max_points:
+            params["maxCount"] = max_points
+
+        _CHUNK = 65536
+        ts = np.empty(_CHUNK, dtype=object)
+        val = np.empty(_CHUNK, dtype=np.float64)
+        n = 0
+        try:
+            with self.session.get(url, params=params, timeout=self.cfg.timeout_sec, stream=True) as r:
+                if r.status_code == 404:
+                    raise PINotFound(f"Resource not found: {r.url}")
+                r.raise_for_status()
+                r.raw.decode_content = True
+                for item in ijson.items(r.raw, "Items.item"):
+                    if n == len(ts):
+                        ts = np.resize(ts, n + _CHUNK)
+                        val = np.resize(val, n + _CHUNK)
+                    v = item.get("Value")
+                    if type(v) is dict:
+                        v = v.get("Value")
+                    ts[n] = item.get("Timestamp")
+                    # ijson yields Decimal for JSON floats; coerce numerics,
+                    # map everything else (states, None) to NaN.
+                    val[n] = float(v) if isinstance(v, (int, float, Decimal)) else np.nan
+                    n += 1
+        except requests.RequestException as e:
+            raise PIWebAPIError(f"HTTP error calling {url}: {e}") from e
+
+        idx = pd.DatetimeIndex(pd.to_datetime(ts[:n], errors="coerce"), name="timestamp")
+        return pd.DataFrame({"value": val[:n]}, index=idx)
+
     def interpolated(
         self,
         tag: str,
         start_time: str,
         end_time: str,
-        interval: str = "1h"
+        interval: str = "1h",
+        fields: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """PIInterpolated -> list of interpolated events at fixed interval."""
-        webid = self.get_point_webid(tag)
-        url = f"{self.base}/streams/{webid}/interpolated"
-        data = self._get(url, startTime=start_time, endTime=end_time, interval=interval)
+        url = self._stream_prefix(tag) + self._INT
+        data = self._get(url, startTime=start_time, endTime=end_time, interval=interval,
+                         selectedFields=fields or self.EVENT_FIELDS)
         return data.get("Items", [])
 
     def summary(
@@ -138,19 +495,20 @@ class PIClient:
         summary_types: Union[str, Iterable[str]] = ("Average",),
         calculation_basis: str = "TimeWeighted",        # 'TimeWeighted' | 'EventWeighted'
         sample_interval: Optional[str] = None,          # e.g., '1h' for interval rollups
-        time_type: str = "Auto"                         # 'Auto'|'Local'|'UTC'
+        time_type: str = "Auto",                        # 'Auto'|'Local'|'UTC'
+        fields: Optional[str] = None
     ) -> Dict[str, Any]:
         """PISummary -> structured summary payload from PI Web API."""
         if isinstance(summary_types, str):
             summary_types = [summary_types]
-        webid = self.get_point_webid(tag)
-        url = f"{self.base}/streams/{webid}/summary"
+        url = self._stream_prefix(tag) + self._SUM
         params = {
             "startTime": start_time,
             "endTime": end_time,
             "summaryType": ",".join(summary_types),
             "calculationBasis": calculation_basis,
             "timeType": time_type,
+            "selectedFields": fields or self.SUMMARY_FIELDS,
         }
         if sample_interval:
             params["sampleType"] = "Interval"
@@ -160,21 +518,175 @@ class PIClient:
     # ---- Convenience: list of events -> pandas.DataFrame ----
     @staticmethod
     def events_to_dataframe(events: List[Dict[str, Any]], value_field: str = "Value"):
+        pd = _get_pandas()
+
+        if not events:
+            return pd.DataFrame()
+
+        # Build columns directly instead of a list-of-dicts: one comprehension
+        # per column, no per-row dict allocation or rescan in the constructor.
+        ts = [it.get("Timestamp") for it in events]
+        # Value may be a nested {'Name':..., 'Value':...} dict. Recorded
+        # streams interleave system-state dicts with scalar readings, so the
+        # unwrap has to stay per-row; a generator keeps it one comprehension.
+        vals = [v.get("Value") if isinstance(v, dict) else v
+                for v in (it.get(value_field) for it in events)]
+
+        # format="ISO8601" + cache=True keeps pandas on its fast C parser
         try:
-            import pandas as pd
+            idx = pd.to_datetime(ts, format="ISO8601", utc=True, cache=True)
+        except (ValueError, TypeError):
+            idx = pd.to_datetime(ts, errors="coerce")
+        idx.name = "timestamp"
+        return pd.DataFrame({"value": vals}, index=idx).sort_index()
+
+
+# ---------- Async client (Tags only) ----------
+class AsyncPIClient:
+    """
+    Async counterpart to PIClient for batch reads of many tags at once.
+    Requires 'aiohttp' (pip install aiohttp).
+
+    Batch methods (each takes an iterable of tags and fans out concurrently):
+      - arc_val_many(tags, time="*")
+      - recorded_many(tags, start_time, end_time, boundary_type="Inside", max_points=None)
+      - interpolated_many(tags, start_time, end_time, interval="1h")
+
+    Results come back as a dict {tag: payload}; a failed tag maps to the
+    exception instead of raising, so one bad tag can't sink the whole batch.
+
+    Use as an async context manager:
+        async with AsyncPIClient(cfg) as client:
+            data = await client.recorded_many(tags, "*-1d", "*")
+    """
+
+    MAX_CONCURRENCY = 64
+
+    def __init__(self, cfg: PIConfig, max_concurrency: int = MAX_CONCURRENCY):
+        try:
+            import aiohttp
         except Exception as e:
-            raise PIWebAPIError("pandas is required for events_to_dataframe(). pip install pandas") from e
-
-        rows = []
-        for it in events:
-            ts = it.get("Timestamp")
-            v = it.get(value_field)
-            # Value may be nested dict with 'Value'
-            if isinstance(v, dict) and "Value" in v:
-                v = v["Value"]
-            rows.append({"timestamp": ts, "value": v})
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-            df = df.set_index("timestamp").sort_index()
-        return df
+            raise PIWebAPIError("AsyncPIClient requires 'aiohttp'. pip install aiohttp") from e
+        if cfg.use_ntlm:
+            raise PIWebAPIError("NTLM auth is not supported by AsyncPIClient; use PIClient instead.")
+
+        self._aiohttp = aiohttp
+        self.cfg = cfg
+        self.base = cfg.base_url.rstrip("/")
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._webid_cache: Dict[str, str] = {}
+        self._session = None
+
+        self._headers = {"Accept": "application/json"}
+        self._auth = None
+        if cfg.bearer_token:
+            self._headers["Authorization"] = f"Bearer {cfg.bearer_token}"
+        elif cfg.username and cfg.password:
+            self._auth = aiohttp.BasicAuth(cfg.username, cfg.password)
+
+    async def __aenter__(self) -> "AsyncPIClient":
+        aiohttp = self._aiohttp
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.MAX_CONCURRENCY, ssl=self.cfg.verify_ssl),
+            timeout=aiohttp.ClientTimeout(total=self.cfg.timeout_sec),
+            headers=self._headers,
+            auth=self._auth,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # ---- Low-level helpers ----
+    async def _get(self, url: str, **params) -> Dict[str, Any]:
+        if self._session is None:
+            raise PIWebAPIError("AsyncPIClient must be used as an async context manager.")
+        aiohttp = self._aiohttp
+        backoff = 0.5
+        async with self._sem:
+            for attempt in range(5):
+                try:
+                    async with self._session.get(url, params=params) as r:
+                        if r.status == 404:
+                            raise PINotFound(f"Resource not found: {r.url}")
+                        if r.status in (429, 503) and attempt < 4:
+                            retry_after = r.headers.get("Retry-After")
+                            delay = float(retry_after) if retry_after else backoff
+                            backoff *= 2
+                            await asyncio.sleep(delay)
+                            continue
+                        r.raise_for_status()
+                        return _loads(await r.read())
+                except aiohttp.ClientError as e:
+                    raise PIWebAPIError(f"HTTP error calling {url}: {e}") from e
+        raise PIWebAPIError(f"Retries exhausted calling {url}")
+
+    async def get_point_webid(self, tag: str) -> str:
+        """Async version of PIClient.get_point_webid with the same exact-match preference."""
+        webid = self._webid_cache.get(tag)
+        if webid is not None:
+            return webid
+        data = await self._get(f"{self.base}/points", nameFilter=tag,
+                               selectedFields=PIClient.POINT_FIELDS)
+        items = data.get("Items", [])
+        if not items:
+            raise PINotFound(f"Tag not found: {tag}")
+        exact = [it for it in items if it.get("Name", "").lower() == tag.lower()]
+        webid = (exact or items)[0].get("WebId")
+        if not webid:
+            raise PINotFound(f"No WebId for tag: {tag}")
+        self._webid_cache[tag] = webid
+        return webid
+
+    async def _fan_out(self, tags: Iterable[str], fetch) -> Dict[str, Any]:
+        """Run fetch(tag) for each tag concurrently; map failures to their exception."""
+        tags = list(tags)
+        results = await asyncio.gather(*(fetch(t) for t in tags), return_exceptions=True)
+        return dict(zip(tags, results))
+
+    # ---- Batch reads ----
+    async def arc_val_many(self, tags: Iterable[str], time: str = "*") -> Dict[str, Any]:
+        async def fetch(tag: str):
+            webid = await self.get_point_webid(tag)
+            return await self._get(f"{self.base}/streams/{webid}/value", time=time)
+        return await self._fan_out(tags, fetch)
+
+    async def recorded_many(
+        self,
+        tags: Iterable[str],
+        start_time: str,
+        end_time: str,
+        boundary_type: str = "Inside",
+        max_points: Optional[int] = None
+    ) -> Dict[str, Any]:
+        async def fetch(tag: str):
+            webid = await self.get_point_webid(tag)
+            params = {"startTime": start_time, "endTime": end_time, "boundaryType": boundary_type,
+                      "selectedFields": PIClient.EVENT_FIELDS}
+            if max_points:
+                params["maxCount"] = max_points
+            data = await self._get(f"{self.base}/streams/{webid}/recorded", **params)
+            return data.get("Items", [])
+        return await self._fan_out(tags, fetch)
+
+    async def interpolated_many(
+        self,
+        tags: Iterable[str],
+        start_time: str,
+        end_time: str,
+        interval: str = "1h"
+    ) -> Dict[str, Any]:
+        async def fetch(tag: str):
+            webid = await self.get_point_webid(tag)
+            data = await self._get(
+                f"{self.base}/streams/{webid}/interpolated",
+                startTime=start_time, endTime=end_time, interval=interval,
+                selectedFields=PIClient.EVENT_FIELDS
+            )
+            return data.get("Items", [])
+        return await self._fan_out(tags, fetch)
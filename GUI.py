@@ -1,47 +1,113 @@
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache, partial
 import calendar
 
 import API_Calls as api
 
 # ---- Static choices ----
-SUBSTATION_VALUES = ["24", "26", "27", "28", "31", "32", "33", "34", "35"]
-LINE_VALUES = ["Line 1", "Line 2", "Line 3"]
-TRANSFORMER_VALUES = ["Transformer 1", "Transformer 2", "Transformer 3"]
-BUS_VALUES = ["bus 1", "bus 2", "bus 3"]
-FEEDER_VALUES = ["8-27.11", "8-27.12", "8-27.13", "8-27.14"]
-
+# Tuples: immutable, and Tkinter converts the same object to a Tcl list once
+# rather than re-encoding a fresh list on every assignment
+SUBSTATION_VALUES = ("24", "26", "27", "28", "31", "32", "33", "34", "35")
+LINE_VALUES = ("Line 1", "Line 2", "Line 3")
+TRANSFORMER_VALUES = ("Transformer 1", "Transformer 2", "Transformer 3")
+BUS_VALUES = ("bus 1", "bus 2", "bus 3")
+FEEDER_VALUES = ("8-27.11", "8-27.12", "8-27.13", "8-27.14")
+
+# Field names are interned so every key floating through the app (combobox
+# vars, shuttle rows, API_KEY_MAP lookups) is the same string object and
+# dict probes/compares hit pointer identity first.
 FIELDS = [
-    ("Substation", SUBSTATION_VALUES),
-    ("Line", LINE_VALUES),
-    ("Transformer", TRANSFORMER_VALUES),
-    ("Bus", BUS_VALUES),
-    ("Feeder", FEEDER_VALUES),
+    (sys.intern("Substation"), SUBSTATION_VALUES),
+    (sys.intern("Line"), LINE_VALUES),
+    (sys.intern("Transformer"), TRANSFORMER_VALUES),
+    (sys.intern("Bus"), BUS_VALUES),
+    (sys.intern("Feeder"), FEEDER_VALUES),
 ]
+FIELD_NAMES = tuple(name for name, _ in FIELDS)
 
 PREVIOUS_RANGES = [
     ("Q2 2025", ("2025-04-01", "2025-06-30")),
     ("June 2025", ("2025-06-01", "2025-06-30")),
 ]
 
+# (preset value, button label) pairs driving the preset radiobutton rows
+DATE_PRESET_LABELS = (
+    ("yesterday", "Yesterday"),
+    ("7", "Last 7 Days"),
+    ("30", "Last 30 Days"),
+    ("365", "Past 12 Months"),
+)
+
+INTERVAL_PRESET_LABELS = (
+    ("15m", "15 minutes"),
+    ("hourly", "Hourly"),
+    ("daily", "Daily"),
+    ("weekly", "Weekly"),
+    ("monthly", "Monthly"),
+)
+
+# preset value -> (days back for start, days back for end)
+DATE_PRESETS = {
+    "yesterday": (1, 1),
+    "7": (6, 0),
+    "30": (29, 0),
+    "365": (364, 0),
+}
+
+INTERVAL_PRESETS = {
+    "15m": ("15", "minute"),
+    "hourly": ("1", "hour"),
+    "daily": ("24", "hour"),
+    "weekly": ("168", "hour"),
+    "monthly": ("720", "hour"),
+}
+
+API_KEY_MAP = {
+    "Substation": "substation",
+    "Line": "line",
+    "Transformer": "transformer",
+    "Bus": "bus",
+    "Feeder": "feeder",
+}
+
+# isoformat/fromisoformat are direct C paths for exactly this format,
+# unlike strftime/strptime which interpret the format string per call
 def to_iso(d: date) -> str:
-    return d.strftime("%Y-%m-%d")
+    return d.isoformat()
 
 def parse_iso(s: str) -> date:
-    return datetime.strptime(s, "%Y-%m-%d").date()
+    return date.fromisoformat(s)
+
+# ---- Calendar helpers (shared/cached across popups) ----
+_CAL = calendar.Calendar(firstweekday=0)
+_MONTH_NAMES = tuple(calendar.month_name)
+
+@lru_cache(maxsize=512)
+def _month_dates(year: int, month: int):
+    return tuple(_CAL.itermonthdates(year, month))
 
 # ---- Simple calendar popup ----
 class DatePickerPopup(tk.Toplevel):
-    def __init__(self, master, initial: date, on_pick):
+    def __init__(self, master, initial: date, on_pick, reusable: bool = False):
         super().__init__(master)
         self.title("Select Date")
         self.transient(master)
         self.resizable(False, False)
         self.on_pick = on_pick
+        # A reusable popup hides instead of destroying itself, so the owner
+        # can re-show it without rebuilding ~50 widgets per open
+        self.reusable = reusable
         self.selected = initial or date.today()
+        self.protocol("WM_DELETE_WINDOW", self._dismiss)
         self.grab_set()
 
+        # Configured once here; _draw_days just assigns the style name
+        ttk.Style(self).configure("Today.TButton", foreground="blue")
+
         self.var_year = tk.IntVar(value=self.selected.year)
         self.var_month = tk.IntVar(value=self.selected.month)
 
@@ -55,11 +121,20 @@ class DatePickerPopup(tk.Toplevel):
         for wd in ["Mo","Tu","We","Th","Fr","Sa","Su"]:
             ttk.Label(hdr, text=wd, width=3, anchor="center").pack(side="left", padx=2)
 
+        # Fixed 6x7 grid of day buttons, created once and reconfigured on each
+        # month flip; creating/destroying ~42 Tk widgets per navigation is the
+        # dominant cost of the popup.
         self.days_frame = ttk.Frame(self); self.days_frame.pack(padx=8, pady=(2,8))
+        self.day_btns = []
+        for r in range(6):
+            for c in range(7):
+                btn = ttk.Button(self.days_frame, text=" ", width=3)
+                btn.grid(row=r, column=c, padx=2, pady=2)
+                self.day_btns.append(btn)
         self._draw_days()
 
     def _month_year_text(self):
-        return f"{calendar.month_name[self.var_month.get()]} {self.var_year.get()}"
+        return f"{_MONTH_NAMES[self.var_month.get()]} {self.var_year.get()}"
 
     def prev_month(self):
         y, m = self.var_year.get(), self.var_month.get()
@@ -76,26 +151,46 @@ class DatePickerPopup(tk.Toplevel):
         self.lbl_month.config(text=self._month_year_text()); self._draw_days()
 
     def _draw_days(self):
-        for w in self.days_frame.winfo_children(): w.destroy()
         y, m = self.var_year.get(), self.var_month.get()
-        cal = calendar.Calendar(firstweekday=0)
         today = date.today()
-        row = col = 0
-        for d in cal.itermonthdates(y, m):
-            if col == 7: col = 0; row += 1
-            btn_text = " " if d.month != m else str(d.day)
-            btn = ttk.Button(self.days_frame, text=btn_text, width=3)
-            btn.grid(row=row, column=col, padx=2, pady=2)
+        i = 0
+        for d in _month_dates(y, m):
+            btn = self.day_btns[i]; i += 1
             if d.month != m:
+                btn.configure(text=" ", command="", style="")
                 btn.state(["disabled"])
             else:
-                if d == today: ttk.Style(self).configure("Today.TButton")
-                btn.configure(command=lambda dd=d: self._pick(dd))
-            col += 1
+                btn.configure(text=str(d.day), command=partial(self._pick, d),
+                              style="Today.TButton" if d == today else "")
+                btn.state(["!disabled"])
+        # Months spanning fewer than six weeks leave trailing blank cells
+        for btn in self.day_btns[i:]:
+            btn.configure(text=" ", command="", style="")
+            btn.state(["disabled"])
+
+    def set_selected(self, d: date):
+        """Point the popup at a new date (used when re-showing a reusable popup)."""
+        self.selected = d
+        self.var_year.set(d.year); self.var_month.set(d.month)
+        self.lbl_month.config(text=self._month_year_text())
+        self._draw_days()
+
+    def show_at_pointer(self):
+        self.deiconify()
+        x = self.winfo_pointerx(); y = self.winfo_pointery()
+        self.geometry(f"+{x}+{y}")
+        self.grab_set()
+
+    def _dismiss(self):
+        if self.reusable:
+            self.grab_release()
+            self.withdraw()
+        else:
+            self.destroy()
 
     def _pick(self, d: date):
         if callable(self.on_pick): self.on_pick(d)
-        self.destroy()
+        self._dismiss()
 
 class DeviceShuttleApp(tk.Tk):
     def __init__(self):
@@ -119,26 +214,51 @@ class DeviceShuttleApp(tk.Tk):
         self.var_date_preset = tk.StringVar(value="")
 
         self.var_interval_value = tk.StringVar(value="15")
+        # Normalize once on write so the query builders never re-strip
+        self.var_interval_value.trace_add("write", self._normalize_interval_value)
         self.var_interval_unit = tk.StringVar(value="minute")
         self.var_interval_preset = tk.StringVar(value="")
 
         # Middle: device pickers
         self.current_values = {name: tk.StringVar(value="") for name, _ in FIELDS}
 
+        # Index of shuttle rows: one dict lookup instead of walking the
+        # Treeview (each tree.set is a Tcl round-trip)
+        self._key_to_iid = {}
+        self._iid_to_key = {}
+
         # Right column (new)
         self.var_ds_min = tk.BooleanVar(value=False)
         self.var_ds_avg = tk.BooleanVar(value=False)    # global Average
         self.var_ds_max = tk.BooleanVar(value=True)     # default checked
+        self._DS_SPECS = ((self.var_ds_min, "Minimum"),
+                          (self.var_ds_avg, "Average"),
+                          (self.var_ds_max, "Maximum"))
+
+        # Preview debounce state
+        self._last_preview = ""
+        self._preview_after = None
+
+        # Background worker for API calls so the event loop never blocks on HTTP
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._run_btn = None
+
+        # One reusable date-picker popup, created on first open
+        self._picker = None
+        self._picker_target_var = None
 
         self.var_output_unit = tk.StringVar(value="Amp")
         self.var_coincidental = tk.BooleanVar(value=False)
         self.var_multi_phase = tk.BooleanVar(value=False)
         self.var_multi_avg = tk.BooleanVar(value=False) # Average under Multi Phase
+        self._mp_last = None  # last applied Multi Phase state
 
         self._build_ui()
 
     # ------------- UI -------------
     def _build_ui(self):
+        # Local aliases: these constructors run dozens of times during startup
+        Label = ttk.Label; Button = ttk.Button; Radiobutton = ttk.Radiobutton
         # Grid: top controls (row 0), middle row (shuttle + right column), bottom preview (row 2)
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=0)
@@ -151,38 +271,36 @@ class DeviceShuttleApp(tk.Tk):
         top_left.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=10, pady=(10,6))
         for i in range(4): top_left.columnconfigure(i, weight=1)
 
-        ttk.Label(top_left, text="Previous Date Ranges:").grid(row=0, column=0, sticky="e", padx=(10,6), pady=6)
+        for text, r in (("Previous Date Ranges:", 0), ("Start Date:", 1), ("End Date:", 2)):
+            Label(top_left, text=text).grid(row=r, column=0, sticky="e", padx=(10,6), pady=6)
+
         self.cb_prev = ttk.Combobox(top_left, state="readonly",
                                     values=[label for (label, _) in self.prev_ranges],
                                     textvariable=self.var_prev_range)
         self.cb_prev.grid(row=0, column=1, sticky="ew", padx=(0,10), pady=6)
-        ttk.Button(top_left, text="Apply", command=self.apply_previous_range)\
+        Button(top_left, text="Apply", command=self.apply_previous_range)\
             .grid(row=0, column=2, sticky="w", padx=(0,10), pady=6)
 
-        ttk.Label(top_left, text="Start Date:").grid(row=1, column=0, sticky="e", padx=(10,6), pady=6)
         self.ent_start = ttk.Entry(top_left, textvariable=self.var_start, width=14)
-        self.ent_start.grid(row=1, column=1, sticky="w", padx=(0,6), pady=6)
-        ttk.Button(top_left, text="📅", width=3, command=lambda: self.open_date_picker(self.var_start))\
-            .grid(row=1, column=2, sticky="w", padx=(0,10), pady=6)
-
-        ttk.Label(top_left, text="End Date:").grid(row=2, column=0, sticky="e", padx=(10,6), pady=6)
         self.ent_end = ttk.Entry(top_left, textvariable=self.var_end, width=14)
-        self.ent_end.grid(row=2, column=1, sticky="w", padx=(0,6), pady=6)
-        ttk.Button(top_left, text="📅", width=3, command=lambda: self.open_date_picker(self.var_end))\
-            .grid(row=2, column=2, sticky="w", padx=(0,10), pady=6)
+        for r, (entry, var) in enumerate(((self.ent_start, self.var_start),
+                                          (self.ent_end, self.var_end)), start=1):
+            entry.grid(row=r, column=1, sticky="w", padx=(0,6), pady=6)
+            Button(top_left, text="📅", width=3, command=partial(self.open_date_picker, var))\
+                .grid(row=r, column=2, sticky="w", padx=(0,10), pady=6)
 
         presets = ttk.Frame(top_left); presets.grid(row=3, column=0, columnspan=4, sticky="w", padx=10, pady=(4,8))
-        ttk.Label(presets, text="Presets:").pack(side="left", padx=(0,8))
-        for val, label in [("yesterday","Yesterday"), ("7","Last 7 Days"), ("30","Last 30 Days"), ("365","Past 12 Months")]:
-            ttk.Radiobutton(presets, text=label, value=val, variable=self.var_date_preset,
-                            command=self.apply_date_preset).pack(side="left", padx=6)
+        Label(presets, text="Presets:").pack(side="left", padx=(0,8))
+        for val, label in DATE_PRESET_LABELS:
+            Radiobutton(presets, text=label, value=val, variable=self.var_date_preset,
+                        command=self.apply_date_preset).pack(side="left", padx=6)
 
         # --- Top Middle-Right: Interval ---
         top_right = ttk.LabelFrame(self, text="Select Time Interval")
         top_right.grid(row=0, column=2, sticky="nsew", padx=(0,10), pady=(10,6))
         for i in range(4): top_right.columnconfigure(i, weight=1)
 
-        ttk.Label(top_right, text="Interval:").grid(row=0, column=0, sticky="e", padx=(10,6), pady=6)
+        Label(top_right, text="Interval:").grid(row=0, column=0, sticky="e", padx=(10,6), pady=6)
         self.spn_interval = ttk.Spinbox(top_right, from_=0, to=60, increment=1,
                                         textvariable=self.var_interval_value, width=6)
         self.spn_interval.grid(row=0, column=1, sticky="w", padx=(0,6), pady=6)
@@ -191,10 +309,10 @@ class DeviceShuttleApp(tk.Tk):
         self.cb_unit.grid(row=0, column=2, sticky="w", padx=(0,10), pady=6)
 
         int_presets = ttk.Frame(top_right); int_presets.grid(row=1, column=0, columnspan=4, sticky="w", padx=10, pady=(4,8))
-        ttk.Label(int_presets, text="Presets:").pack(side="left", padx=(0,8))
-        for val, label in [("15m","15 minutes"), ("hourly","Hourly"), ("daily","Daily"), ("weekly","Weekly"), ("monthly","Monthly")]:
-            ttk.Radiobutton(int_presets, text=label, value=val, variable=self.var_interval_preset,
-                            command=self.apply_interval_preset).pack(side="left", padx=6)
+        Label(int_presets, text="Presets:").pack(side="left", padx=(0,8))
+        for val, label in INTERVAL_PRESET_LABELS:
+            Radiobutton(int_presets, text=label, value=val, variable=self.var_interval_preset,
+                        command=self.apply_interval_preset).pack(side="left", padx=6)
 
         # --- Middle Left: Device selection + arrows + selected (shuttle) ---
         self.columnconfigure(0, weight=1, minsize=260)
@@ -206,14 +324,14 @@ class DeviceShuttleApp(tk.Tk):
         left.columnconfigure(1, weight=1)
         self.combos = {}
         for r, (label, values) in enumerate(FIELDS):
-            ttk.Label(left, text=label + ":").grid(row=r, column=0, padx=(10, 6), pady=8, sticky="e")
+            Label(left, text=label + ":").grid(row=r, column=0, padx=(10, 6), pady=8, sticky="e")
             combo = ttk.Combobox(left, values=values, textvariable=self.current_values[label], state="readonly")
             combo.grid(row=r, column=1, padx=(0, 10), pady=8, sticky="ew")
             self.combos[label] = combo
 
         mid = ttk.Frame(self); mid.grid(row=1, column=1, sticky="ns", pady=6)
         for r, (label, _) in enumerate(FIELDS):
-            ttk.Button(mid, text="➜", width=3, command=lambda key=label: self.add_selection(key))\
+            Button(mid, text="➜", width=3, command=partial(self.add_selection, label))\
                 .grid(row=r, column=0, padx=6, pady=8, sticky="n")
 
         right = ttk.LabelFrame(self, text="Selected Devices")
@@ -228,9 +346,9 @@ class DeviceShuttleApp(tk.Tk):
 
         btns = ttk.Frame(right); btns.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(4, 10))
         for i in range(3): btns.columnconfigure(i, weight=1)
-        ttk.Button(btns, text="Remove Selected", command=self.remove_selected).grid(row=0, column=0, sticky="ew", padx=4)
-        ttk.Button(btns, text="Clear All", command=self.clear_all).grid(row=0, column=1, sticky="ew", padx=4)
-        ttk.Button(btns, text="Build REST Query", command=self.build_rest_query).grid(row=0, column=2, sticky="ew", padx=4)
+        Button(btns, text="Remove Selected", command=self.remove_selected).grid(row=0, column=0, sticky="ew", padx=4)
+        Button(btns, text="Clear All", command=self.clear_all).grid(row=0, column=1, sticky="ew", padx=4)
+        Button(btns, text="Build REST Query", command=self.build_rest_query).grid(row=0, column=2, sticky="ew", padx=4)
 
         # --- NEW: Far Right Column with single stacked column ---
         far_right = ttk.LabelFrame(self, text="Options")
@@ -266,10 +384,12 @@ class DeviceShuttleApp(tk.Tk):
         self.chk_multi_avg.grid(row=1, column=0, sticky="w", padx=22, pady=(2,6))
         self._toggle_multi_avg()  # initialize disabled state
 
-        # Bottom: Preview
-        self.preview = tk.Text(self, height=6, wrap="word")
+        # Bottom: Preview. A Label is far cheaper than a Text widget (no tag
+        # table, marks or undo machinery) and the preview is read-only anyway.
+        self.var_preview = tk.StringVar()
+        self.preview = ttk.Label(self, textvariable=self.var_preview,
+                                 wraplength=1100, justify="left", anchor="nw")
         self.preview.grid(row=2, column=0, columnspan=4, sticky="ew", padx=10, pady=(0,10))
-        self.preview.configure(state="disabled")
 
         # Defaults for device combos
         for name, values in FIELDS:
@@ -282,9 +402,17 @@ class DeviceShuttleApp(tk.Tk):
             current = parse_iso(var.get())
         except Exception:
             current = date.today()
-        popup = DatePickerPopup(self, current, on_pick=lambda d: var.set(to_iso(d)))
-        x = self.winfo_pointerx(); y = self.winfo_pointery()
-        popup.geometry(f"+{x}+{y}")
+        self._picker_target_var = var
+        if self._picker is None:
+            self._picker = DatePickerPopup(self, current, on_pick=self._on_date_picked,
+                                           reusable=True)
+        else:
+            self._picker.set_selected(current)
+        self._picker.show_at_pointer()
+
+    def _on_date_picked(self, d: date):
+        if self._picker_target_var is not None:
+            self._picker_target_var.set(to_iso(d))
 
     def apply_previous_range(self):
         label = self.var_prev_range.get()
@@ -296,29 +424,25 @@ class DeviceShuttleApp(tk.Tk):
         messagebox.showinfo("No range", "Select a previous range to apply.")
 
     def apply_date_preset(self):
-        today = date.today()
-        val = self.var_date_preset.get()
-        if val == "yesterday":
-            start = today - timedelta(days=1); end = today - timedelta(days=1)
-        elif val in {"7", "30", "365"}:
-            days = int(val); start = today - timedelta(days=days-1); end = today
-        else:
+        deltas = DATE_PRESETS.get(self.var_date_preset.get())
+        if not deltas:
             return
-        self.var_start.set(to_iso(start)); self.var_end.set(to_iso(end))
+        today = date.today()
+        start_back, end_back = deltas
+        self.var_start.set(to_iso(today - timedelta(days=start_back)))
+        self.var_end.set(to_iso(today - timedelta(days=end_back)))
 
     # ------------- Interval helpers -------------
+    def _normalize_interval_value(self, *_):
+        v = self.var_interval_value.get()
+        s = v.strip()
+        if s != v:
+            self.var_interval_value.set(s)
+
     def apply_interval_preset(self):
-        preset = self.var_interval_preset.get()
-        if preset == "15m":
-            self.var_interval_value.set("15"); self.var_interval_unit.set("minute")
-        elif preset == "hourly":
-            self.var_interval_value.set("1"); self.var_interval_unit.set("hour")
-        elif preset == "daily":
-            self.var_interval_value.set("24"); self.var_interval_unit.set("hour")
-        elif preset == "weekly":
-            self.var_interval_value.set("168"); self.var_interval_unit.set("hour")
-        elif preset == "monthly":
-            self.var_interval_value.set("720"); self.var_interval_unit.set("hour")
+        value, unit = INTERVAL_PRESETS.get(self.var_interval_preset.get(), (None, None))
+        if value:
+            self.var_interval_value.set(value); self.var_interval_unit.set(unit)
 
     # ------------- Shuttle logic -------------
     def add_selection(self, key: str):
@@ -326,81 +450,85 @@ class DeviceShuttleApp(tk.Tk):
         if not value:
             messagebox.showinfo("No value selected", f"Please choose a value for '{key}' first.")
             return
-        existing = self._find_item_by_key(key)
+        existing = self._key_to_iid.get(key)
         if existing:
             self.tree.set(existing, "value", value)
         else:
-            self.tree.insert("", "end", values=(key, value))
-
-    def _find_item_by_key(self, key: str):
-        for iid in self.tree.get_children(""):
-            if self.tree.set(iid, "key") == key:
-                return iid
-        return None
+            iid = self.tree.insert("", "end", values=(key, value))
+            self._key_to_iid[key] = iid
+            self._iid_to_key[iid] = key
 
     def remove_selected(self):
-        for iid in self.tree.selection(): self.tree.delete(iid)
+        for iid in self.tree.selection():
+            self.tree.delete(iid)
+            key = self._iid_to_key.pop(iid, None)
+            if key is not None:
+                self._key_to_iid.pop(key, None)
 
     def clear_all(self):
         for iid in self.tree.get_children(""): self.tree.delete(iid)
+        self._key_to_iid.clear()
+        self._iid_to_key.clear()
 
     def get_selected_params(self) -> dict:
-        params = {}
-        for iid in self.tree.get_children(""):
-            k = self.tree.set(iid, "key"); v = self.tree.set(iid, "value")
-            params[k] = v
-        return params
+        # item(iid, "values") returns both columns in one Tcl crossing
+        return {vals[0]: vals[1]
+                for iid in self.tree.get_children("")
+                for vals in (self.tree.item(iid, "values"),)}
 
     # ------------- Right column  -------------
     def _toggle_multi_avg(self):
-        if self.var_multi_phase.get():
-            self.chk_multi_avg.state(["!disabled"])
-        else:
+        on = self.var_multi_phase.get()
+        if on == self._mp_last:
+            return  # no actual transition: skip the Tcl calls entirely
+        self._mp_last = on
+        self.chk_multi_avg.state(["!disabled"] if on else ["disabled"])
+        if not on:
             self.var_multi_avg.set(False)
-            self.chk_multi_avg.state(["disabled"])
 
     # ------------- Build query / preview -------------
-    def build_rest_query(self):
+    def _collect_api_params(self):
+        """
+        Validate the form and build the APIParams dataclass shared by the
+        preview and run paths. Returns (params, None) on success or
+        (None, error_message) when validation fails.
+        """
         # ----- Validate dates -----
         try:
             start_d = parse_iso(self.var_start.get()); end_d = parse_iso(self.var_end.get())
         except Exception:
-            messagebox.showerror("Invalid date", "Start/End dates must be YYYY-MM-DD.")
-            return
+            return None, "Start/End dates must be YYYY-MM-DD."
         if start_d > end_d:
-            messagebox.showerror("Invalid range", "Start Date must be on or before End Date.")
-            return
+            return None, "Start Date must be on or before End Date."
 
         # ----- Devices converted to API keys -----
         device_params_gui = self.get_selected_params()
-        api_key_map = {
-            "Substation": "substation",
-            "Line": "line",
-            "Transformer": "transformer",
-            "Bus": "bus",
-            "Feeder": "feeder",
-        }
-        device_params = {api_key_map.get(k, k): v for k, v in device_params_gui.items()}
+        device_params = {API_KEY_MAP.get(k, k): v for k, v in device_params_gui.items()}
 
         # ----- Datasets list -----
-        datasets = []
-        if self.var_ds_min.get(): datasets.append("Minimum")
-        if self.var_ds_avg.get(): datasets.append("Average")
-        if self.var_ds_max.get(): datasets.append("Maximum")
+        datasets = [name for v, name in self._DS_SPECS if v.get()]
 
         # ----- Build the APIParams dataclass -----
         params = api.build_api_params(
             device_params=device_params,
             start_date=self.var_start.get(),
             end_date=self.var_end.get(),
-            interval_value=self.var_interval_value.get().strip(),
-            interval_unit=(self.var_interval_unit.get().strip() or "minute"),
+            interval_value=self.var_interval_value.get(),
+            # readonly combobox, initialized to "minute": always a valid choice
+            interval_unit=self.var_interval_unit.get(),
             datasets=datasets,
             output_unit=self.var_output_unit.get(),
             coincidental_peaks=self.var_coincidental.get(),
             multi_phase=self.var_multi_phase.get(),
             multi_phase_average=self.var_multi_avg.get(),
         )
+        return params, None
+
+    def build_rest_query(self):
+        params, err = self._collect_api_params()
+        if err:
+            messagebox.showerror("Invalid input", err)
+            return
 
         # ----- Compose URL for preview -----
         full_url = api.compose_url(self.api_config.base_url, params)
@@ -412,53 +540,51 @@ class DeviceShuttleApp(tk.Tk):
         # You can call this from your UI builder to add a "Run" button near "Build REST Query"
         btn = ttk.Button(parent_frame, text="Run Query", command=self.run_query)
         btn.grid(row=0, column=3, sticky="ew", padx=4)
+        self._run_btn = btn
 
     def run_query(self):
-        # Call the API and show a simple result dialog.
-        # (Consider running this in a background thread for long calls)
-        # Build params exactly as in build_rest_query, but without preview-only bits:
-        try:
-            start_d = parse_iso(self.var_start.get()); end_d = parse_iso(self.var_end.get())
-        except Exception:
-            messagebox.showerror("Invalid date", "Start/End dates must be YYYY-MM-DD.")
+        # Call the API on the worker pool and deliver the result back to the
+        # Tk thread via after(); the UI stays responsive during the round-trip.
+        params, err = self._collect_api_params()
+        if err:
+            messagebox.showerror("Invalid input", err)
             return
-        if start_d > end_d:
-            messagebox.showerror("Invalid range", "Start Date must be on or before End Date.")
-            return
-
-        device_params_gui = self.get_selected_params()
-        api_key_map = {"Substation":"substation","Line":"line","Transformer":"transformer","Bus":"bus","Feeder":"feeder"}
-        device_params = {api_key_map.get(k, k): v for k, v in device_params_gui.items()}
-
-        datasets = []
-        if self.var_ds_min.get(): datasets.append("Minimum")
-        if self.var_ds_avg.get(): datasets.append("Average")
-        if self.var_ds_max.get(): datasets.append("Maximum")
 
-        params = api.build_api_params(
-            device_params=device_params,
-            start_date=self.var_start.get(),
-            end_date=self.var_end.get(),
-            interval_value=self.var_interval_value.get().strip(),
-            interval_unit=(self.var_interval_unit.get().strip() or "minute"),
-            datasets=datasets,
-            output_unit=self.var_output_unit.get(),
-            coincidental_peaks=self.var_coincidental.get(),
-            multi_phase=self.var_multi_phase.get(),
-            multi_phase_average=self.var_multi_avg.get(),
-        )
+        if self._run_btn is not None:
+            self._run_btn.state(["disabled"])
+        fut = self._pool.submit(api.execute_query, self.api_config, params)
+        fut.add_done_callback(lambda f: self.after(0, self._on_query_done, f))
 
-        status, text = api.execute_query(self.api_config, params)
+    def _on_query_done(self, fut):
+        if self._run_btn is not None:
+            self._run_btn.state(["!disabled"])
+        try:
+            status, text = fut.result()
+        except Exception as ex:
+            messagebox.showerror("Error", f"Query failed:\n{ex}")
+            return
         if status == 200:
             messagebox.showinfo("Success", "Request succeeded.\n\n(Preview)\n" + text[:1000])
         else:
             messagebox.showerror("Error", f"Status {status}\n{text[:1000]}")
 
+    def destroy(self):
+        self._pool.shutdown(wait=False)
+        super().destroy()
+
     def _set_preview(self, text: str):
-        self.preview.configure(state="normal")
-        self.preview.delete("1.0", "end")
-        self.preview.insert("1.0", text)
-        self.preview.configure(state="disabled")
+        # Skip identical content and coalesce rapid updates (preset spamming)
+        # into one text-widget rewrite so the event loop stays responsive.
+        if text == self._last_preview:
+            return
+        if self._preview_after is not None:
+            self.after_cancel(self._preview_after)
+        self._preview_after = self.after(30, lambda: self._apply_preview(text))
+
+    def _apply_preview(self, text: str):
+        self._preview_after = None
+        self._last_preview = text
+        self.var_preview.set(text)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from __future__ import annotations
 import io
 import json
 import hashlib
+import os
 import tempfile
 from dataclasses import asdict
 from typing import Iterable, Optional, Tuple, List, Dict
@@ -10,6 +11,26 @@ from typing import Iterable, Optional, Tuple, List, Dict
 import pandas as pd
 import matplotlib.pyplot as plt
 
+# Optional accelerators: orjson decodes large JSON 2-5x faster than stdlib;
+# pyarrow builds columnar frames without per-cell Python boxing.
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+try:
+    import pyarrow as pa
+except Exception:
+    pa = None
+# ijson streams large payloads incrementally instead of holding the whole
+# parsed object tree next to the source string.
+try:
+    import ijson as _ijson
+except Exception:
+    _ijson = None
+
+# Payloads above this size are parsed incrementally when ijson is available.
+_STREAM_THRESHOLD_BYTES = 1 << 20
+
 # Import your API layer
 from API_Calls import (
     APIConfig, APIParams, build_api_params, compose_url,
@@ -48,8 +69,21 @@ def fetch_to_dataframe(cfg: APIConfig, params: APIParams) -> pd.DataFrame:
 
     # Ensure timestamp is datetime (if present)
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+        df['timestamp'] = _to_datetime(df['timestamp'])
         df = df.dropna(subset=['timestamp']).sort_values('timestamp')
+        # Second resolution is all PI archives carry; halves the column width.
+        # astype refuses tz-aware input, so drop the zone (as naive UTC) first.
+        if getattr(df['timestamp'].dtype, 'tz', None) is not None:
+            df['timestamp'] = df['timestamp'].dt.tz_convert('UTC').dt.tz_localize(None)
+        df['timestamp'] = df['timestamp'].astype('datetime64[s]')
+        # Downstream consumers (resample_timeseries) skip their own sorts
+        # when this flag survives; pandas propagates attrs through most ops.
+        df.attrs['sorted'] = True
+
+    if 'value' in df.columns:
+        # float32 keeps ~7 significant digits — plenty for meter readings —
+        # and halves bandwidth through every later reduction and cache write.
+        df['value'] = pd.to_numeric(df['value'], errors='coerce', downcast='float')
 
     # Attach unit if present in params (fallback)
     if 'unit' not in df.columns and getattr(params, 'output_unit', None):
@@ -58,7 +92,17 @@ def fetch_to_dataframe(cfg: APIConfig, params: APIParams) -> pd.DataFrame:
     # Normalize column order
     ordered_cols = [c for c in ['timestamp', 'tag', 'stat', 'value', 'unit'] if c in df.columns]
     rest = [c for c in df.columns if c not in ordered_cols]
-    df = df[ordered_cols + rest]
+    # reindex relabels the existing blocks lazily under Copy-on-Write
+    # instead of materializing a reordered copy.
+    df = df.reindex(columns=ordered_cols + rest)
+
+    # Low-cardinality label columns as category: groupby hashes small int
+    # codes instead of strings, and cached files dictionary-encode them
+    # (Arrow maps category to dictionary type in both Feather and Parquet,
+    # shrinking the repeated-string columns roughly by the repeat factor).
+    for c in ('tag', 'stat', 'unit'):
+        if c in df.columns:
+            df[c] = df[c].astype('category')
 
     return df
 
@@ -80,70 +124,149 @@ def resample_timeseries(
     if df.empty:
         return df.copy()
 
+    if not callable(how) and how not in ('mean', 'sum', 'min', 'max'):
+        raise ValueError(f"Unsupported aggregation: {how!r}")
+
     gkeys = [k for k in group_keys if k in df.columns]
     if gkeys:
-        out = []
-        for keys, sub in df.groupby(gkeys):
-            sub = sub.sort_values('timestamp').set_index('timestamp')
-            if how == "sum":
-                r = sub['value'].resample(interval).sum()
-            elif how == "min":
-                r = sub['value'].resample(interval).min()
-            elif how == "max":
-                r = sub['value'].resample(interval).max()
-            else:
-                r = sub['value'].resample(interval).mean()
-
-            r = r.reset_index().rename(columns={'value': 'value'})
-            # restore group columns
-            if isinstance(keys, tuple):
-                for k, v in zip(gkeys, keys):
-                    r[k] = v
-            else:
-                r[gkeys[0]] = keys
-            out.append(r)
-        res = pd.concat(out, ignore_index=True)
+        if callable(how):
+            # Custom aggregations can't go through the vectorized Grouper
+            # path; resample per group, in parallel when there are many.
+            res = _resample_groups(df, interval, how, gkeys)
+        else:
+            # One vectorized groupby over (group keys, time bin) instead of a
+            # Python loop resampling and concatenating per group. Bins come
+            # from .dt.floor, whose cost scales with row count — a Resampler
+            # would allocate one bin per interval across [min_ts, max_ts],
+            # which a single outlier timestamp can blow up to millions of
+            # empty bins. Calendar offsets ('M', 'W', ...) have no fixed
+            # width, so those fall back to pd.Grouper.
+            try:
+                bins = df['timestamp'].dt.floor(interval).rename('timestamp')
+            except ValueError:
+                bins = pd.Grouper(key='timestamp', freq=interval)
+            res = (
+                df.groupby(gkeys + [bins], sort=False, observed=True)['value']
+                  .agg(how)
+                  .reset_index()
+            )
         # Reorder
         ordered_cols = [c for c in ['timestamp', 'tag', 'stat', 'value', 'unit'] if c in res.columns]
         rest = [c for c in res.columns if c not in ordered_cols]
-        return res[ordered_cols + rest].sort_values('timestamp')
+        # Each group's rows come out time-ordered already, so the global
+        # interleave is nearly sorted; mergesort is ~O(N) on such input.
+        res = res.reindex(columns=ordered_cols + rest)
+        return res.sort_values('timestamp', kind='mergesort')
     else:
-        sub = df.sort_values('timestamp').set_index('timestamp')
-        if how == "sum":
-            r = sub['value'].resample(interval).sum()
-        elif how == "min":
-            r = sub['value'].resample(interval).min()
-        elif how == "max":
-            r = sub['value'].resample(interval).max()
-        else:
-            r = sub['value'].resample(interval).mean()
-        return r.reset_index().rename(columns={'value': 'value'})
+        # Same floor-based binning as above; only calendar offsets need the
+        # Resampler's evenly-spaced bin index.
+        try:
+            bins = df['timestamp'].dt.floor(interval).rename('timestamp')
+        except ValueError:
+            sub = df if df.attrs.get('sorted') else df.sort_values('timestamp')
+            r = sub.set_index('timestamp')['value'].resample(interval).agg(how)
+            return r.reset_index()
+        # Output must stay time-ordered like the Resampler's was: first-seen
+        # bin order is only chronological when the input was already sorted.
+        r = df.groupby(bins, sort=not df.attrs.get('sorted'))['value'].agg(how)
+        return r.reset_index()
+
+
+# Lazily-created Figure/Axes pair reused across plot_timeseries calls so
+# repeated run_and_plot invocations don't re-allocate a canvas every time.
+_FIG: Optional[plt.Figure] = None
+_AX = None
+
+
+def _fetch_to_table(cfg: APIConfig, params: APIParams) -> "pa.Table":
+    """
+    Arrow-native variant of fetch_to_dataframe: same fetch and normalization,
+    returned as a pa.Table so downstream steps (resample_table, caching) can
+    stay columnar and defer the pandas materialization to the edge. Parsing
+    and normalization already run once in pandas, so this converts that
+    single frame rather than re-scanning.
+    """
+    if pa is None:
+        raise ValueError("pyarrow is required for the Arrow pipeline.")
+    return pa.Table.from_pandas(fetch_to_dataframe(cfg, params), preserve_index=False)
+
+
+def resample_table(
+    tbl: "pa.Table",
+    interval: str,
+    how: str = "mean",
+    group_keys: Iterable[str] = ('tag', 'stat')
+) -> "pa.Table":
+    """
+    Resample an Arrow table by a polars duration string (e.g. '5m', '1h').
+    With polars installed, the lazy plan fuses sort + dynamic grouping +
+    reduction into one streaming multi-threaded pass; without it (or for
+    intervals/aggregations polars rejects) the pandas resample_timeseries
+    path runs instead.
+    """
+    gkeys = [k for k in group_keys if k in tbl.column_names]
+    if how in ('mean', 'sum', 'min', 'max'):
+        try:
+            import polars as pl
+            lf = (
+                pl.from_arrow(tbl).lazy()
+                  .sort('timestamp')
+                  .group_by_dynamic('timestamp', every=interval, group_by=gkeys)
+                  .agg(getattr(pl.col('value'), how)())
+            )
+            try:
+                out = lf.collect(engine="streaming")
+            except TypeError:
+                # polars < 1.25 predates the engine parameter.
+                out = lf.collect(streaming=True)
+            return out.to_arrow()
+        except Exception:
+            pass
+    res = resample_timeseries(tbl.to_pandas(), interval, how=how, group_keys=group_keys)
+    return pa.Table.from_pandas(res, preserve_index=False)
 
 
 def plot_timeseries(
     df: pd.DataFrame,
     title: str = "PI Time Series",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    ax: Optional[plt.Axes] = None
 ) -> plt.Figure:
     """
     Simple matplotlib line plot of value vs timestamp.
     - If multiple 'tag' or 'stat' groups, draws one line per group.
+    - Pass `ax` to draw into your own Axes; otherwise a module-cached
+      Figure/Axes is cleared and reused instead of allocated per call.
     Returns the matplotlib Figure.
     """
+    global _FIG, _AX
+
     if df.empty:
         raise ValueError("Nothing to plot: DataFrame is empty.")
 
     if 'timestamp' not in df.columns or 'value' not in df.columns:
         raise ValueError("DataFrame needs 'timestamp' and 'value' columns to plot.")
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    if ax is None:
+        if _AX is None:
+            _FIG, _AX = plt.subplots(figsize=(10, 5))
+        ax = _AX
+    fig = ax.figure
+    ax.cla()
 
     group_cols = [c for c in ['tag', 'stat'] if c in df.columns]
     if group_cols:
-        for keys, sub in df.groupby(group_cols):
-            label = " - ".join([str(k) for k in (keys if isinstance(keys, tuple) else (keys,))])
-            ax.plot(sub['timestamp'], sub['value'], label=label)
-        ax.legend()
+        # Pivot once to a wide frame and draw every series in a single
+        # Matplotlib call, instead of one groupby slice + plot per group.
+        wide = df.pivot_table(
+            index='timestamp', columns=group_cols, values='value',
+            sort=False, observed=True,
+        )
+        wide.columns = [
+            " - ".join(str(k) for k in (keys if isinstance(keys, tuple) else (keys,)))
+            for keys in wide.columns
+        ]
+        wide.plot(ax=ax, legend=True)
     else:
         ax.plot(df['timestamp'], df['value'])
 
@@ -158,22 +281,163 @@ def plot_timeseries(
     return fig
 
 
-def cache_dataframe_parquet(df: pd.DataFrame, key_obj: Dict) -> str:
+def _cache_fmt(fmt: Optional[str]) -> str:
+    """Resolve the cache format: Arrow IPC by default when pyarrow exists."""
+    if fmt is None:
+        return "arrow" if pa is not None else "parquet"
+    if fmt not in ("arrow", "parquet"):
+        raise ValueError(f"Unsupported cache format: {fmt!r}")
+    return fmt
+
+
+def _cache_path(key_obj: Dict, fmt: Optional[str] = None) -> str:
+    """
+    Stable cache filename hashed from key_obj (e.g., the params dict).
+    repr of the sorted items is deterministic for the flat params dict and
+    skips a JSON serialization; blake2b with an 8-byte digest is faster than
+    sha256 and plenty of collision margin for a temp-dir cache.
     """
-    Saves the DataFrame to a Parquet file under the system temp directory.
-    key_obj is hashed to create a stable cache filename (e.g., params dict).
-    Returns the path to the saved file.
+    cache_key = hashlib.blake2b(
+        repr(sorted(key_obj.items())).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return f"{tempfile.gettempdir()}/pi_cache_{cache_key}.{_cache_fmt(fmt)}"
+
+
+def cache_dataframe_parquet(df: pd.DataFrame, key_obj: Dict,
+                            fmt: Optional[str] = None) -> str:
     """
-    cache_key = hashlib.sha256(json.dumps(key_obj, sort_keys=True).encode("utf-8")).hexdigest()[:16]
-    path = f"{tempfile.gettempdir()}/pi_cache_{cache_key}.parquet"
-    df.to_parquet(path, index=False)
+    Saves the DataFrame to a cache file under the system temp directory.
+    The default format (with pyarrow installed) is Arrow IPC — Feather v2,
+    deliberately uncompressed so load_dataframe_cache can memory-map it.
+    Pass fmt='parquet' for a smaller durable file: zstd-1 roughly halves
+    the size at similar write speed, and 256K-row groups with statistics
+    let readers skip row groups whose min/max timestamp falls outside a
+    requested slice. Returns the path to the file.
+    """
+    fmt = _cache_fmt(fmt)
+    path = _cache_path(key_obj, fmt)
+    # Same key => same contents; skip the rewrite on a warm cache.
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        return path
+    # Write to a private temp name, then rename atomically so concurrent
+    # readers never see a half-written file.
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        if fmt == "arrow":
+            import pyarrow.feather as feather
+            feather.write_feather(
+                pa.Table.from_pandas(df, preserve_index=False),
+                tmp,
+                compression="uncompressed",
+            )
+        elif pa is not None:
+            import pyarrow.parquet as pq
+            pq.write_table(
+                pa.Table.from_pandas(df, preserve_index=False), tmp,
+                compression='zstd', compression_level=1,
+                row_group_size=262144, use_dictionary=True,
+                write_statistics=True,
+            )
+        else:
+            # No pyarrow: pandas' fallback engine takes none of the tuning
+            # options, so write with its defaults.
+            df.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
     return path
 
 
+def load_dataframe_cache(key_obj: Dict, fmt: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Reload a DataFrame cached by cache_dataframe_parquet for the same key_obj
+    (and fmt), or None if no cache file exists. Arrow IPC files are
+    memory-mapped, so the OS pages columns in lazily instead of
+    deserializing the whole file.
+    """
+    path = _cache_path(key_obj, fmt)
+    if not os.path.exists(path):
+        return None
+    if pa is not None and path.endswith(".arrow"):
+        source = pa.memory_map(path)
+        reader = pa.ipc.RecordBatchFileReader(source)
+        return reader.read_all().to_pandas(types_mapper=pd.ArrowDtype)
+    return pd.read_parquet(path)
+
+
 # -----------------------------
 # Helpers (internal)
 # -----------------------------
 
+def _to_datetime(series: pd.Series) -> pd.Series:
+    """
+    Parse a timestamp column, preferring pyarrow's single-pass strptime for
+    the ISO-8601 strings PI returns; anything it cannot handle falls back to
+    pd.to_datetime's per-element parser. Tz-aware results are normalized to
+    naive UTC so downstream dtype casts stay uniform.
+    """
+    # is_string_dtype covers object as well as the pandas str/ArrowDtype
+    # string columns that newer pandas infers by default.
+    if pa is not None and pd.api.types.is_string_dtype(series.dtype):
+        try:
+            import pyarrow.compute as pc
+            arr = pa.array(series, type=pa.string())
+            out = pc.strptime(arr, format='%Y-%m-%dT%H:%M:%S%z', unit='ns').to_pandas()
+            if getattr(out.dtype, 'tz', None) is not None:
+                out = out.dt.tz_convert('UTC').dt.tz_localize(None)
+            out.index = series.index
+            return out
+        except Exception:
+            pass
+    out = pd.to_datetime(series, errors='coerce')
+    if getattr(out.dtype, 'tz', None) is not None:
+        out = out.dt.tz_convert('UTC').dt.tz_localize(None)
+    return out
+
+
+def _resample_chunk(chunk: pd.DataFrame, interval: str, how, gkeys: List[str]) -> pd.DataFrame:
+    """Resample each group in `chunk` with an arbitrary aggregation `how`."""
+    out = []
+    pre_sorted = bool(chunk.attrs.get('sorted'))
+    for keys, sub in chunk.groupby(gkeys, sort=False, observed=True):
+        if not pre_sorted:
+            sub = sub.sort_values('timestamp')
+        r = (sub.set_index('timestamp')['value']
+                .resample(interval).agg(how).reset_index())
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        for k, v in zip(gkeys, keys):
+            r[k] = v
+        out.append(r)
+    return pd.concat(out, ignore_index=True) if out else chunk.iloc[0:0]
+
+
+def _resample_groups(df: pd.DataFrame, interval: str, how, gkeys: List[str]) -> pd.DataFrame:
+    """
+    Per-group resample for callable aggregations. Groups are embarrassingly
+    parallel, so with many of them the work is hashed into ~one chunk of
+    groups per core and run through joblib; small inputs (or no joblib)
+    stay sequential to avoid worker startup overhead.
+    """
+    bucket = df.groupby(gkeys, sort=False, observed=True).ngroup()
+    n_groups = int(bucket.max()) + 1 if len(bucket) else 0
+    n_chunks = min(os.cpu_count() or 1, max(1, n_groups // 100))
+    if n_groups > 64 and n_chunks > 1:
+        try:
+            from joblib import Parallel, delayed
+        except Exception:
+            pass
+        else:
+            bucket = bucket % n_chunks
+            parts = Parallel(n_jobs=-1, backend="loky")(
+                delayed(_resample_chunk)(df[bucket == b], interval, how, gkeys)
+                for b in range(n_chunks)
+            )
+            return pd.concat(parts, ignore_index=True)
+    return _resample_chunk(df, interval, how, gkeys)
+
+
 def _parse_pi_response_to_df(text: str) -> pd.DataFrame:
     """
     Attempt to parse a PI Web API response into a tidy DataFrame.
@@ -185,9 +449,19 @@ def _parse_pi_response_to_df(text: str) -> pd.DataFrame:
     2) {"Items":[{"Timestamp":"...","Value":1.2,"Name":"tagA","UnitsAbbreviation":"Amp"}, ...]}
     3) {"Timestamps":[...], "Values":[...], "Name":"tagA"}
     """
+    # Large payloads: stream 'Items' incrementally so only one series is
+    # materialized at a time instead of the whole object tree.
+    if _ijson is not None and len(text) > _STREAM_THRESHOLD_BYTES:
+        try:
+            df = _parse_items_streaming(text)
+            if not df.empty:
+                return df
+        except Exception:
+            pass
+
     # JSON first
     try:
-        obj = json.loads(text)
+        obj = _orjson.loads(text) if _orjson is not None else json.loads(text)
         df = _parse_json_variants(obj)
         if not df.empty:
             return df
@@ -197,23 +471,27 @@ def _parse_pi_response_to_df(text: str) -> pd.DataFrame:
     # CSV fallback
     try:
         df_csv = pd.read_csv(io.StringIO(text))
-        # Try to infer columns
-        cols = {c.lower(): c for c in df_csv.columns}
-        ts_col = cols.get('timestamp') or cols.get('time') or cols.get('datetime')
-        val_col = cols.get('value') or cols.get('values')
-        tag_col = cols.get('tag') or cols.get('name') or cols.get('point')
-        unit_col = cols.get('unit') or cols.get('units') or cols.get('unitsabbreviation')
-
-        out = pd.DataFrame()
-        if ts_col and val_col:
-            out['timestamp'] = pd.to_datetime(df_csv[ts_col], errors='coerce')
-            out['value'] = pd.to_numeric(df_csv[val_col], errors='coerce')
-            if tag_col:
-                out['tag'] = df_csv[tag_col].astype(str)
-            if unit_col:
-                out['unit'] = df_csv[unit_col].astype(str)
-            out = out.dropna(subset=['timestamp'])
-            return out
+        # Pick one source column per canonical target using the shared alias
+        # precedence, then rename once. A blind rename of every alias would
+        # emit duplicate columns when a file carries e.g. both 'Time' and
+        # 'Timestamp' headers.
+        lower = {}
+        for c in df_csv.columns:
+            lower.setdefault(c.lower(), c)
+        canon = {}
+        for target in ('timestamp', 'value', 'tag', 'unit'):
+            for alias in _CANON_PRIORITY[target]:
+                if alias in lower:
+                    canon[lower[alias]] = target
+                    break
+        if {'timestamp', 'value'}.issubset(canon.values()):
+            out = df_csv.loc[:, list(canon)].rename(columns=canon)
+            out['timestamp'] = _to_datetime(out['timestamp'])
+            out['value'] = pd.to_numeric(out['value'], errors='coerce')
+            for c in ('tag', 'unit'):
+                if c in out.columns:
+                    out[c] = out[c].astype(str)
+            return out.dropna(subset=['timestamp'])
     except Exception:
         pass
 
@@ -221,11 +499,39 @@ def _parse_pi_response_to_df(text: str) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def _parse_items_streaming(text: str) -> pd.DataFrame:
+    """
+    Incrementally parse an 'Items' payload with ijson, converting each series
+    (or the accumulated flat rows) through the same variant logic as the
+    in-memory path. Peak memory stays near one payload copy because the full
+    parsed object tree never exists at once.
+    """
+    frames: List[pd.DataFrame] = []
+    rows: List[dict] = []
+    with io.BytesIO(text.encode('utf-8')) as bio:
+        for item in _ijson.items(bio, 'Items.item'):
+            if isinstance(item, dict) and isinstance(item.get('Items'), list):
+                f = _parse_json_variants({'Items': [item]})
+                if not f.empty:
+                    frames.append(f)
+            elif isinstance(item, dict):
+                rows.append(item)
+    if frames:
+        return pd.concat(frames, ignore_index=True)
+    if rows:
+        return _parse_json_variants({'Items': rows})
+    return pd.DataFrame()
+
+
 def _parse_json_variants(obj: dict) -> pd.DataFrame:
     # Variant 1: Items -> list of series, each with its own Items
     if isinstance(obj, dict) and isinstance(obj.get("Items"), list):
         # Detect nested items per tag
         if obj["Items"] and isinstance(obj["Items"][0], dict) and "Items" in obj["Items"][0]:
+            if pa is not None:
+                arrow = _variant1_arrow(obj["Items"])
+                if arrow is not None:
+                    return arrow
             frames = []
             for series in obj["Items"]:
                 tag = series.get("Name") or series.get("Label") or series.get("Path") or series.get("WebId")
@@ -255,7 +561,19 @@ def _parse_json_variants(obj: dict) -> pd.DataFrame:
 
     # Variant 3: paired arrays
     if all(k in obj for k in ('Timestamps','Values')) and isinstance(obj['Timestamps'], list):
-        f = pd.DataFrame({'timestamp': obj['Timestamps'], 'value': obj['Values']})
+        f = None
+        if pa is not None:
+            # Columnar build: contiguous Arrow buffers, no per-cell boxing
+            try:
+                tbl = pa.table({
+                    'timestamp': _arrow_ts(obj['Timestamps']),
+                    'value': pa.array(obj['Values'], type=pa.float64()),
+                })
+                f = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+            except Exception:
+                f = None
+        if f is None:
+            f = pd.DataFrame({'timestamp': obj['Timestamps'], 'value': obj['Values']})
         f['tag']  = obj.get('Name') or obj.get('Label') or obj.get('Path')
         if obj.get('UnitsAbbreviation'):
             f['unit'] = obj['UnitsAbbreviation']
@@ -264,20 +582,86 @@ def _parse_json_variants(obj: dict) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def _arrow_ts(values) -> "pa.Array":
+    """
+    Cast ISO timestamp strings to naive-UTC ns timestamps. Z/offset-suffixed
+    strings — the normal PI wire format — refuse a naive target ("expected no
+    zone offset"), so those go through a tz-aware cast first and drop the
+    zone afterwards.
+    """
+    arr = pa.array(values)
+    try:
+        return arr.cast(pa.timestamp('ns'))
+    except Exception:
+        return arr.cast(pa.timestamp('ns', 'UTC')).cast(pa.timestamp('ns'))
+
+
+def _variant1_arrow(series_list: list) -> Optional[pd.DataFrame]:
+    """
+    Build the nested-Items variant as one Arrow record batch per series and
+    concatenate with pa.Table.from_batches — a buffer-list append, so the
+    value arrays are never copied the way pd.concat copies every block.
+    Returns None (caller falls back to the pandas path) on any shape the
+    fast path does not cover, e.g. aliased keys or non-numeric values.
+    """
+    try:
+        str_dict = pa.dictionary(pa.int32(), pa.string())
+        batches = []
+        for series in series_list:
+            items = series.get("Items") or []
+            if not (isinstance(items, list) and items and isinstance(items[0], dict)):
+                continue
+            if 'Timestamp' not in items[0] or 'Value' not in items[0]:
+                return None
+            n = len(items)
+            tag = series.get("Name") or series.get("Label") or series.get("Path") or series.get("WebId")
+            stat = series.get("Stat") or series.get("SummaryType")
+            unit = series.get("UnitsAbbreviation") or series.get("Unit")
+            batches.append(pa.record_batch({
+                'timestamp': _arrow_ts([it.get('Timestamp') for it in items]),
+                'value': pa.array([it.get('Value') for it in items], type=pa.float64()),
+                'tag': pa.array([tag] * n, type=str_dict),
+                'stat': pa.array([stat] * n, type=str_dict),
+                'unit': pa.array([unit] * n, type=str_dict),
+            }))
+        if not batches:
+            return None
+        # Default conversion (no ArrowDtype mapper): dictionary columns land
+        # as plain pandas Categoricals, which keep working through the
+        # category casts downstream even when some series lack stat/unit —
+        # null-bearing ArrowDtype dictionaries crash astype('category').
+        f = pa.Table.from_batches(batches).to_pandas()
+        # Match the pandas path: only keep stat/unit when some series had them.
+        for c in ('stat', 'unit'):
+            if f[c].isna().all():
+                del f[c]
+        return f
+    except Exception:
+        return None
+
+
+# Known column aliases (lowercased) per canonical name, in precedence order:
+# when a file carries several aliases of the same target (e.g. both 'Time'
+# and 'Timestamp'), the earliest listed one wins.
+_CANON_PRIORITY = {
+    'timestamp': ('timestamp', 'time', 'datetime', 'localtimestamp', 'utcseconds'),
+    'value': ('value', 'values', 'val', 'doublevalue', 'numericvalue'),
+    'tag': ('tag', 'name', 'point', 'path', 'label'),
+    'unit': ('unit', 'units', 'unitsabbreviation'),
+    'stat': ('stat', 'summarytype', 'type'),
+}
+
+# Flat alias -> canonical map; one dict probe per column in
+# _rename_common_keys instead of five tuple scans.
+_CANON = {
+    alias: target
+    for target, aliases in _CANON_PRIORITY.items()
+    for alias in aliases
+}
+
+
 def _rename_common_keys(df: pd.DataFrame) -> None:
-    mapping = {}
-    for c in df.columns:
-        lc = c.lower()
-        if lc in ('timestamp','time','datetime','localtimestamp','utcseconds'):
-            mapping[c] = 'timestamp'
-        elif lc in ('value','val','doublevalue','numericvalue'):
-            mapping[c] = 'value'
-        elif lc in ('name','tag','point','path','label'):
-            mapping[c] = 'tag'
-        elif lc in ('units','unit','unitsabbreviation'):
-            mapping[c] = 'unit'
-        elif lc in ('summarytype','stat','type'):
-            mapping[c] = 'stat'
+    mapping = {c: _CANON[c.lower()] for c in df.columns if c.lower() in _CANON}
     if mapping:
         df.rename(columns=mapping, inplace=True)
 